@@ -5,17 +5,21 @@ Compatible with Hex Status 2.0 authentication system
 """
 
 import os
+import re
 import sys
 import json
 import time
 import uuid
 import socket
+import struct
 import hashlib
 import platform
 import datetime
+import functools
+import math
 import urllib.request
 import urllib.error
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 import base64
 
 try:
@@ -28,11 +32,107 @@ except ImportError:
 
 try:
     # For encryption/decryption
-    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-    from cryptography.hazmat.backends import default_backend
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     HAS_CRYPTO = True
 except ImportError:
     HAS_CRYPTO = False
+    
+    class InvalidTag(Exception):
+        """Placeholder so validate_offline can always name the exception"""
+
+try:
+    # SIMD-accelerated hashing for HWID generation
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+try:
+    # Faster JSON (de)serialization, works on bytes directly
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+try:
+    # Linux interface ioctls for MAC lookup
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Minimum SHA-256 throughput expected from a SHA-NI/ARMv8 accelerated OpenSSL
+SHA256_MIN_THROUGHPUT = 500 * 1024 * 1024  # bytes/second
+_shani_probed = False
+
+# HWIDs already generated in this process, keyed by (hash algorithm, HWID version)
+_hwid_cache: Dict[Tuple[str, int], str] = {}
+
+# Linux system information files
+CPUINFO_FILE = '/proc/cpuinfo'
+OS_RELEASE_FILE = '/etc/os-release'
+
+# Linux network interface ioctl (see linux/sockios.h and linux/if_arp.h)
+SIOCGIFHWADDR = 0x8927
+ARPHRD_ETHER = 1
+IFNAMSIZ = 16
+
+# Flags for writing the license cache in a single open/write
+CACHE_OPEN_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                    | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+
+# MAC address as printed on ifconfig 'ether' lines
+_MAC_RE = re.compile(r'ether\s+([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})')
+
+
+def _h256(data: bytes) -> bytes:
+    """One-shot SHA-256 digest (routes straight to OpenSSL)"""
+    return hashlib.sha256(data).digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_uname() -> Tuple[str, str, str]:
+    """(system, release, machine) from a single uname() call where available"""
+    if hasattr(os, 'uname'):
+        uname = os.uname()
+        return uname.sysname, uname.release, uname.machine
+    return platform.system(), platform.release(), platform.machine()
+
+
+@functools.lru_cache(maxsize=None)
+def _import_requests() -> Optional[Any]:
+    """Import requests on first use (it is slow to import), or None if unavailable"""
+    try:
+        import requests
+        return requests
+    except ImportError:
+        return None
+
+
+def _natural_key(name: str) -> List[Union[str, int]]:
+    """Sort key comparing digit runs as integers, like net-tools' nstrcmp()"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+def _probe_shani() -> None:
+    """Warn once per process if SHA-256 looks like it lacks hardware acceleration"""
+    global _shani_probed
+    if _shani_probed:
+        return
+    _shani_probed = True
+    
+    buf = bytes(1024 * 1024)
+    start = time.perf_counter()
+    _h256(buf)
+    elapsed = time.perf_counter() - start
+    
+    if elapsed > 0 and len(buf) / elapsed < SHA256_MIN_THROUGHPUT:
+        print(f"Warning: SHA-256 throughput is {len(buf) / elapsed / 1024 / 1024:.0f} MB/s; "
+              "your OpenSSL build may lack SHA-NI support, consider upgrading it")
 
 
 class LicenseClient:
@@ -41,6 +141,11 @@ class LicenseClient:
     # Constants
     OFFLINE_GRACE_DAYS = 7
     API_TIMEOUT = 10  # seconds
+    HWID_ALGORITHMS = ('sha256', 'blake2b', 'blake3')
+    HWID_VERSIONS = (1, 2)
+    GCM_IV_SIZE = 12  # bytes
+    GCM_TAG_SIZE = 16  # bytes
+    IV_POOL_NONCES = 16  # nonces drawn per os.urandom() call
 
     def __init__(self, **options):
         """Initialize the license client"""
@@ -50,6 +155,26 @@ class LicenseClient:
         self.version = options.get('version', '2.0.0')
         self.license_key = options.get('license_key', None)
         
+        # Hash used for the HWID and cache key. Changing this changes the HWID,
+        # so 'sha256' stays the default for compatibility with existing bindings.
+        self.hwid_algorithm = options.get('hwid_algorithm', 'sha256')
+        if self.hwid_algorithm not in self.HWID_ALGORITHMS:
+            raise ValueError(f"Unsupported hwid_algorithm: {self.hwid_algorithm}")
+        if self.hwid_algorithm == 'blake3' and not HAS_BLAKE3:
+            print("Warning: blake3 module not available, falling back to SHA-256 for HWID")
+            self.hwid_algorithm = 'sha256'
+        
+        # Optional one-time check that SHA-256 is hardware accelerated (hashes 1 MB)
+        if options.get('audit_hashing', False):
+            _probe_shani()
+        
+        # System fields that make up the HWID. Version 1 (kernel release and
+        # platform.processor(), which spawns 'uname -p') matches existing bindings;
+        # version 2 reads /etc/os-release and /proc/cpuinfo instead.
+        self.hwid_version = options.get('hwid_version', 1)
+        if self.hwid_version not in self.HWID_VERSIONS:
+            raise ValueError(f"Unsupported hwid_version: {self.hwid_version}")
+        
         # Set up cache directory
         self.cache_dir = options.get('cache_dir', os.path.join(os.path.expanduser('~'), '.hexlicense'))
         self.cache_file = os.path.join(self.cache_dir, 'license.cache')
@@ -58,12 +183,43 @@ class LicenseClient:
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
         
-        # Generate hardware ID
-        self.hwid = self.generate_hwid()
+        # Generate hardware ID (memoized per process)
+        self.hwid = self._load_hwid()
         
         # Initialize state
         self.license_info = None
         self.offline_mode = False
+        self._iv_pool = b''
+        self._iv_pool_pid = None
+        self._session = None
+
+    @property
+    def license_info(self) -> Optional[Dict[str, Any]]:
+        return self._license_info
+    
+    @license_info.setter
+    def license_info(self, value: Optional[Dict[str, Any]]) -> None:
+        # Route through _set_license_info so the parsed expiry and features stay in sync
+        self._set_license_info(value)
+    
+    @property
+    def hwid(self) -> str:
+        return self._hwid
+    
+    @hwid.setter
+    def hwid(self, value: str) -> None:
+        self._hwid = value
+        # Drop the derived encryption key so it is recomputed for the new HWID
+        self.__dict__.pop('_enc_key', None)
+        self.__dict__.pop('_aesgcm', None)
+    
+    def _load_hwid(self) -> str:
+        """Return the HWID computed earlier in this process, generating it if needed"""
+        cache_key = (self.hwid_algorithm, self.hwid_version)
+        hwid = _hwid_cache.get(cache_key)
+        if hwid is None:
+            hwid = _hwid_cache[cache_key] = self.generate_hwid()
+        return hwid
 
     def generate_hwid(self) -> str:
         """Generate a hardware ID based on system information"""
@@ -72,12 +228,15 @@ class LicenseClient:
         # Get hostname
         system_info.append(socket.gethostname())
         
+        system, release, machine = _get_uname()
+        legacy = self.hwid_version == 1
+        
         # Get OS info
-        system_info.append(platform.system())
-        system_info.append(platform.release())
+        system_info.append(system)
+        system_info.append(release if legacy else self._get_os_version() or release)
         
-        # Get CPU info
-        system_info.append(platform.processor())
+        # Get CPU info (platform.processor() kept for the version 1 HWID layout)
+        system_info.append(platform.processor() if legacy else self._get_cpu_model() or machine)
         system_info.append(str(os.cpu_count()))
         
         # Get MAC addresses
@@ -104,13 +263,14 @@ class LicenseClient:
                         if len(parts) >= 3:
                             mac = parts[2].strip('"')
                             mac_addresses.append(mac)
+            elif sys.platform.startswith('linux') and HAS_FCNTL:
+                # Linux: query MACs with one ioctl per interface instead of spawning ifconfig
+                mac_addresses.extend(self._read_linux_macs())
             else:
-                # Linux/Mac
+                # Mac/other Unix
                 import subprocess
                 output = subprocess.check_output('ifconfig -a || /sbin/ifconfig -a', shell=True).decode('utf-8')
-                import re
-                mac_pattern = re.compile(r'ether\s+([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})')
-                matches = mac_pattern.findall(output)
+                matches = _MAC_RE.findall(output)
                 mac_addresses.extend(matches)
         
         if mac_addresses:
@@ -123,7 +283,56 @@ class LicenseClient:
         
         # Join all information and create hash
         system_string = '|'.join(filter(None, system_info))
-        return hashlib.sha256(system_string.encode()).hexdigest()
+        return self._hash(system_string.encode()).hex()
+
+    def _get_os_version(self) -> Optional[str]:
+        """Read the distribution ID and version from /etc/os-release"""
+        try:
+            with open(OS_RELEASE_FILE, 'r') as f:
+                fields = dict(line.rstrip('\n').split('=', 1) for line in f if '=' in line)
+        except OSError:
+            return None
+        
+        os_id = fields.get('ID', '').strip('"\'')
+        version_id = fields.get('VERSION_ID', '').strip('"\'')
+        return ' '.join(filter(None, (os_id, version_id))) or None
+    
+    def _get_cpu_model(self) -> Optional[str]:
+        """Read the CPU model name from /proc/cpuinfo"""
+        try:
+            with open(CPUINFO_FILE, 'r') as f:
+                # The first processor entry is enough
+                cpuinfo = f.read(4096)
+        except OSError:
+            return None
+        
+        for line in cpuinfo.splitlines():
+            key, _, value = line.partition(':')
+            if key.strip() == 'model name':
+                return value.strip()
+        return None
+
+    def _read_linux_macs(self) -> List[str]:
+        """Read Ethernet MAC addresses via SIOCGIFHWADDR, in ifconfig order"""
+        mac_addresses = []
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            # Sort by name, in ifconfig's natural order (eth2 before eth10), so the
+            # HWID is stable regardless of interface indexes
+            for _, name in sorted(socket.if_nameindex(), key=lambda item: _natural_key(item[1])):
+                ifreq = struct.pack('256s', name.encode()[:IFNAMSIZ - 1])
+                try:
+                    result = fcntl.ioctl(sock.fileno(), SIOCGIFHWADDR, ifreq)
+                except OSError:
+                    continue
+                
+                # struct ifreq: name[IFNAMSIZ], then sockaddr (sa_family, sa_data)
+                family = struct.unpack_from('H', result, IFNAMSIZ)[0]
+                if family != ARPHRD_ETHER:
+                    continue
+                
+                hwaddr = result[IFNAMSIZ + 2:IFNAMSIZ + 8]
+                mac_addresses.append(':'.join(f'{b:02x}' for b in hwaddr))
+        return mac_addresses
 
     def validate(self) -> bool:
         """Validate license with the API server"""
@@ -136,10 +345,11 @@ class LicenseClient:
         # Try to validate online
         try:
             # Prepare request data
+            system, release, machine = _get_uname()
             machine_info = {
-                'os': platform.system(),
-                'version': platform.release(),
-                'arch': platform.machine(),
+                'os': system,
+                'version': release,
+                'arch': machine,
                 'hostname': socket.gethostname()
             }
             
@@ -157,44 +367,42 @@ class LicenseClient:
                 'User-Agent': f'HexLicense-PythonClient/{self.version}'
             }
             
-            req = urllib.request.Request(
-                f"{self.api_url}/verify",
-                data=json.dumps(request_data).encode('utf-8'),
-                headers=headers,
-                method='POST'
-            )
+            response_data = self._post_json(f"{self.api_url}/verify", request_data, headers)
             
-            with urllib.request.urlopen(req, timeout=self.API_TIMEOUT) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
+            if response_data.get('valid'):
+                # License is valid
+                self._set_license_info({
+                    'valid': True,
+                    'expiresAt': response_data.get('expiresAt'),
+                    'features': response_data.get('features', []),
+                    'owner': response_data.get('owner', 'Unknown'),
+                    'validatedAt': datetime.datetime.utcnow().isoformat(),
+                    'offlineMode': False
+                })
                 
-                if response_data.get('valid'):
-                    # License is valid
-                    self.license_info = {
-                        'valid': True,
-                        'expiresAt': response_data.get('expiresAt'),
-                        'features': response_data.get('features', []),
-                        'owner': response_data.get('owner', 'Unknown'),
-                        'validatedAt': datetime.datetime.utcnow().isoformat(),
-                        'offlineMode': False
-                    }
-                    
-                    self.offline_mode = False
-                    
-                    # Save license info to cache
-                    self.save_cache()
-                    
-                    print("License validated successfully")
-                    return True
-                else:
-                    # License is invalid
-                    self.license_info = {
-                        'valid': False,
-                        'error': response_data.get('error', 'License validation failed')
-                    }
-                    
-                    print(f"License validation failed: {self.license_info['error']}")
+                self.offline_mode = False
+                
+                # The local clock decides expiry (as in is_valid), so don't report or
+                # cache a license that is already past expiresAt here
+                if time.time() >= self._expires_ts:
+                    print("License validation failed: license has expired (check the system clock)")
                     return False
                 
+                # Save license info to cache
+                self.save_cache()
+                
+                print("License validated successfully")
+                return True
+            else:
+                # License is invalid
+                self._set_license_info({
+                    'valid': False,
+                    'error': response_data.get('error', 'License validation failed')
+                })
+                
+                print(f"License validation failed: {self.license_info['error']}")
+                return False
+            
         except Exception as e:
             print(f"License validation error: {str(e)}")
             
@@ -205,13 +413,40 @@ class LicenseClient:
             
             return False
 
-    def validate_offline(self) -> bool:
-        """Try to validate using cached license data"""
-        try:
-            pass  # Placeholder for the actual validation logic
-        except Exception as e:
-            print(f"Error during offline validation: {str(e)}")
-            return False
+    def _post_json(self, url: str, payload: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """POST a JSON payload and return the decoded JSON response"""
+        if self._session is None:
+            requests = _import_requests()
+            if requests is not None:
+                self._session = requests.Session()
+        
+        if self._session is not None:
+            # Reuse one session so later calls skip the TCP/TLS handshake
+            response = self._session.post(url, data=_dumps(payload), headers=headers, timeout=self.API_TIMEOUT)
+            response.raise_for_status()
+            return _loads(response.content)
+        
+        req = urllib.request.Request(
+            url,
+            data=_dumps(payload),
+            headers=headers,
+            method='POST'
+        )
+        
+        with urllib.request.urlopen(req, timeout=self.API_TIMEOUT) as response:
+            return _loads(response.read())
+
+    def close(self) -> None:
+        """Release the pooled HTTP connection, if any"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> 'LicenseClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def validate_offline(self) -> bool:
         """Try to validate using cached license data"""
@@ -220,56 +455,98 @@ class LicenseClient:
                 return False
             
             # Read and decrypt cache file
-            with open(self.cache_file, 'r') as f:
+            with open(self.cache_file, 'rb') as f:
                 data = f.read()
+            
+            if len(data) < self.GCM_IV_SIZE + self.GCM_TAG_SIZE:
+                return False
                 
-            # Parse IV and encrypted data
-            iv_hex, encrypted_data_hex = data.split(':')
-            iv = bytes.fromhex(iv_hex)
-            encrypted_data = bytes.fromhex(encrypted_data_hex)
+            # Split IV from encrypted data (which ends with the authentication tag)
+            iv = data[:self.GCM_IV_SIZE]
+            encrypted_data = data[self.GCM_IV_SIZE:]
             
             # Check if crypto is available
             if not HAS_CRYPTO:
                 print("Warning: cryptography module not available, can't decrypt cache")
                 return False
             
-            # Generate key from HWID
-            key = self._get_encryption_key()
-            
-            # Decrypt data
-            decrypted = self._decrypt_aes(encrypted_data, key, iv)
-            cache = json.loads(decrypted)
+            # Decrypt data with the HWID-derived key
+            decrypted = self._decrypt_aes(encrypted_data, iv)
+            cache = _loads(decrypted)
             
             # Check if cache is valid
             if 'validatedAt' not in cache or 'expiresAt' not in cache:
                 return False
             
             # Check cache expiration (offline limit)
-            validated_at = datetime.datetime.fromisoformat(cache['validatedAt'])
-            now = datetime.datetime.utcnow()
-            offline_limit = datetime.timedelta(days=self.OFFLINE_GRACE_DAYS)
-            offline_expires = validated_at + offline_limit
+            now = time.time()
+            offline_limit = datetime.timedelta(days=self.OFFLINE_GRACE_DAYS).total_seconds()
+            offline_expires = self._parse_timestamp(cache['validatedAt']) + offline_limit
             
             if now > offline_expires:
                 print("Offline validation period expired")
                 return False
             
             # Check if license has expired
-            if cache['expiresAt'] and now > datetime.datetime.fromisoformat(cache['expiresAt']):
+            expires_ts = self._get_expiry_timestamp(cache)
+            if now >= expires_ts:
                 print("Cached license has expired")
                 return False
             
             # Set license info from cache
-            self.license_info = cache
-            self.license_info['offlineMode'] = True
+            cache['offlineMode'] = True
+            self._set_license_info(cache, expires_ts)
             self.offline_mode = True
             
             return True
             
+        except InvalidTag:
+            print("Offline validation error: cached license is corrupt or from an older client")
+            return False
         except Exception as e:
             print(f"Offline validation error: {str(e)}")
             return False
 
+    def _set_license_info(self, info: Optional[Dict[str, Any]], expires_ts: Optional[float] = None) -> None:
+        """Store license info and pre-parse its expiry for fast validity checks"""
+        self._license_info = info
+        if info is None:
+            self._expires_ts = math.inf
+            self._features = frozenset()
+            return
+        
+        self._expires_ts = self._get_expiry_timestamp(info) if expires_ts is None else expires_ts
+        # Feature names are strings; other entries (e.g. objects) can't match has_feature()
+        # and may not be hashable, so skip them rather than failing validation
+        self._features = frozenset(
+            feature for feature in info.get('features') or () if isinstance(feature, str)
+        )
+    
+    def _get_expiry_timestamp(self, info: Dict[str, Any]) -> float:
+        """POSIX timestamp at which the license expires (inf if it never does)"""
+        expires_at = info.get('expiresAt')
+        if not expires_at:
+            return math.inf
+        
+        try:
+            return self._parse_timestamp(expires_at)
+        except (TypeError, ValueError, AttributeError):
+            # The server confirmed this license; don't fail it over a date format,
+            # online or from cache (offline use is still bounded by OFFLINE_GRACE_DAYS)
+            print(f"Warning: could not parse license expiry: {expires_at}")
+            return math.inf
+    
+    @staticmethod
+    def _parse_timestamp(value: str) -> float:
+        """Convert an ISO 8601 string to a POSIX timestamp (naive values are UTC)"""
+        # fromisoformat() only accepts a 'Z' suffix from Python 3.11
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        parsed = datetime.datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+        return parsed.timestamp()
+
     def save_cache(self) -> bool:
         """Save license information to encrypted cache"""
         try:
@@ -282,23 +559,26 @@ class LicenseClient:
                 return False
             
             # Encrypt the cache data
-            key = self._get_encryption_key()
-            iv = os.urandom(16)  # Generate random IV
-            
-            json_data = json.dumps(self.license_info)
-            encrypted_data = self._encrypt_aes(json_data, key, iv)
+            iv = self._next_iv()  # Random 96-bit nonce
             
-            # Store IV with encrypted data
-            iv_hex = iv.hex()
-            encrypted_hex = encrypted_data.hex()
-            encrypted_combined = f"{iv_hex}:{encrypted_hex}"
+            json_data = _dumps(self.license_info)
+            encrypted_data = self._encrypt_aes(json_data, iv)
             
-            # Write to file
-            with open(self.cache_file, 'w') as f:
-                f.write(encrypted_combined)
+            # Store IV with encrypted data and authentication tag (raw binary)
+            encrypted_combined = iv + encrypted_data
             
-            # Set secure permissions
-            os.chmod(self.cache_file, 0o600)
+            # Write to file, created with owner-only permissions
+            fd = os.open(self.cache_file, CACHE_OPEN_FLAGS, 0o600)
+            try:
+                # The mode above only applies on creation; tighten an existing file too
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(fd, 0o600)
+                
+                view = memoryview(encrypted_combined)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             
             return True
             
@@ -306,45 +586,46 @@ class LicenseClient:
             print(f"Failed to save license cache: {str(e)}")
             return False
     
+    @functools.cached_property
+    def _enc_key(self) -> bytes:
+        """Encryption key derived from the current HWID"""
+        return self._get_encryption_key()
+    
     def _get_encryption_key(self) -> bytes:
         """Generate a key from the HWID"""
-        return hashlib.sha256(self.hwid.encode()).digest()
+        return self._hash(self.hwid.encode())[:32]
     
-    def _encrypt_aes(self, data: str, key: bytes, iv: bytes) -> bytes:
-        """Encrypt data using AES-256-CBC"""
-        backend = default_backend()
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=backend)
-        encryptor = cipher.encryptor()
-        
-        # Pad data to block size
-        padded_data = self._pad_data(data.encode())
-        
-        return encryptor.update(padded_data) + encryptor.finalize()
+    def _hash(self, data: bytes) -> bytes:
+        """Hash data with the configured HWID algorithm (32-byte digest)"""
+        if self.hwid_algorithm == 'blake3':
+            return blake3.blake3(data).digest()
+        if self.hwid_algorithm == 'blake2b':
+            return hashlib.blake2b(data, digest_size=32).digest()
+        return _h256(data)
     
-    def _decrypt_aes(self, data: bytes, key: bytes, iv: bytes) -> str:
-        """Decrypt data using AES-256-CBC"""
-        backend = default_backend()
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=backend)
-        decryptor = cipher.decryptor()
+    def _next_iv(self) -> bytes:
+        """Take a fresh random GCM nonce from the pool, refilling it when empty"""
+        # A forked child must not reuse nonces already handed out to its parent
+        if len(self._iv_pool) < self.GCM_IV_SIZE or self._iv_pool_pid != os.getpid():
+            self._iv_pool = os.urandom(self.GCM_IV_SIZE * self.IV_POOL_NONCES)
+            self._iv_pool_pid = os.getpid()
         
-        decrypted_data = decryptor.update(data) + decryptor.finalize()
-        
-        # Remove padding
-        unpadded_data = self._unpad_data(decrypted_data)
-        
-        return unpadded_data.decode('utf-8')
+        iv, self._iv_pool = self._iv_pool[:self.GCM_IV_SIZE], self._iv_pool[self.GCM_IV_SIZE:]
+        return iv
+    
+    @functools.cached_property
+    def _aesgcm(self) -> 'AESGCM':
+        """AES-256-GCM context for the HWID-derived key, reused across cache operations"""
+        return AESGCM(self._enc_key)
     
-    def _pad_data(self, data: bytes) -> bytes:
-        """PKCS7 padding"""
-        block_size = 16
-        padding_size = block_size - (len(data) % block_size)
-        padding = bytes([padding_size] * padding_size)
-        return data + padding
+    def _encrypt_aes(self, data: bytes, iv: bytes) -> bytes:
+        """Encrypt data using AES-256-GCM, returning ciphertext with the tag appended"""
+        return self._aesgcm.encrypt(iv, data, None)
     
-    def _unpad_data(self, data: bytes) -> bytes:
-        """Remove PKCS7 padding"""
-        padding_size = data[-1]
-        return data[:-padding_size]
+    def _decrypt_aes(self, data: bytes, iv: bytes) -> bytes:
+        """Decrypt and authenticate data (ciphertext + tag) using AES-256-GCM"""
+        # Raises InvalidTag if the cache was tampered with
+        return self._aesgcm.decrypt(iv, data, None)
     
     def display_license_info(self) -> None:
         """Print license information to console"""
@@ -359,11 +640,12 @@ class LicenseClient:
             print(f"Product: {self.product_id}")
             print(f"Owner: {self.license_info.get('owner', 'Unknown')}")
             
-            if self.license_info.get('expiresAt'):
-                expires_at = datetime.datetime.fromisoformat(self.license_info['expiresAt'])
-                now = datetime.datetime.utcnow()
-                days_left = (expires_at - now).days
+            if self._expires_ts != math.inf:
+                expires_at = datetime.datetime.fromtimestamp(self._expires_ts, datetime.timezone.utc)
+                days_left = math.floor((self._expires_ts - time.time()) / 86400)
                 print(f"Expires: {expires_at.strftime('%Y-%m-%d')} ({days_left} days left)")
+            elif self.license_info.get('expiresAt'):
+                print(f"Expires: {self.license_info['expiresAt']}")
             else:
                 print("Expires: Never")
                 
@@ -382,7 +664,8 @@ class LicenseClient:
     
     def is_valid(self) -> bool:
         """Check if license is valid"""
-        return self.license_info is not None and self.license_info.get('valid', False)
+        return (self.license_info is not None and self.license_info.get('valid', False)
+                and time.time() < self._expires_ts)
     
     def is_offline_mode(self) -> bool:
         """Check if running in offline mode"""
@@ -390,11 +673,7 @@ class LicenseClient:
     
     def has_feature(self, feature_name: str) -> bool:
         """Check if a specific feature is available"""
-        if not self.is_valid():
-            return False
-            
-        features = self.license_info.get('features', [])
-        return feature_name in features
+        return self.is_valid() and feature_name in self._features
 
 
 # Example usage